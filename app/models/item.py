@@ -31,7 +31,7 @@ class Item(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     product_name: str = Field(index=True)
-    best_before_date: date  # MHD for purchased items, production date for homemade
+    best_before_date: date = Field(index=True)  # MHD for purchased items, production date for homemade
     freeze_date: date | None = Field(default=None)  # Date when item was frozen
     quantity: float = Field(gt=0)
     unit: str  # e.g., "kg", "L", "pieces"
@@ -112,7 +112,7 @@ def show_login_page() -> None:
 
             # Formular
             with ui.column().classes("w-full gap-4"):
-                username_input = ui.input("Benutzername").classes("w-full").props("outlined")
+                username_input = ui.input("Benutzername").classes("w-full").props("outlined").mark("login-username")
 
                 password_input = (
                     ui.input(
@@ -122,6 +122,7 @@ def show_login_page() -> None:
                     )
                     .classes("w-full")
                     .props("outlined")
+                    .mark("login-password")
                 )
 
                 # Remember-Me Checkbox
@@ -133,7 +134,7 @@ def show_login_page() -> None:
                 # Login Button - groesser fuer Touch (min 48px), Solarpunk primary button
                 ui.button("Anmelden", on_click=handle_login).classes("w-full mt-4 sp-btn-primary").props(
                     "size=lg"
-                ).style("min-height: 48px")
+                ).style("min-height: 48px").mark("login-button")
 
 
 def logout() -> None:
@@ -346,7 +346,7 @@ def create_item_card(
                     )
 
                     # Expiry badge (color-coded, Issue #212)
-                    ui.label(badge_text).classes(f"expiry-badge {badge_class}")
+                    ui.label(badge_text).classes(f"expiry-badge {badge_class}").mark("expiry-badge")
 
                 # === BODY ZONE ===
                 # Quantity + Progress Bar + Tags (left side)
@@ -361,7 +361,9 @@ def create_item_card(
                         qty_classes = "text-sm text-gray-700"
                         if has_withdrawals:
                             qty_classes = "text-sm text-amber-700"
-                        ui.label(qty_display).classes(qty_classes).style("font-weight: 600; min-width: 70px;")
+                        ui.label(qty_display).classes(qty_classes).style("font-weight: 600; min-width: 70px;").mark(
+                            "quantity"
+                        )
 
                         # Progress bar (only shown when partial withdrawal exists)
                         if has_withdrawals:
@@ -375,9 +377,11 @@ def create_item_card(
                                 show_value=False,
                             ).props(f'aria-label="Restmenge: {percentage}%" rounded').classes("flex-1").style(
                                 "border-radius: 10px;"
-                            )
+                            ).mark("progress-bar")
                             # Show percentage text for accessibility
-                            ui.label(f"{percentage}%").classes("text-xs text-stone").style("min-width: 35px;")
+                            ui.label(f"{percentage}%").classes("text-xs text-stone").style("min-width: 35px;").mark(
+                                "progress-percentage"
+                            )
 
                     # Tags: Item-Type + Category
                     with ui.row().classes("items-center gap-2 flex-wrap"):
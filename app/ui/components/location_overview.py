@@ -9,6 +9,14 @@ from collections.abc import Sequence
 from nicegui import ui
 
 
+# Location type to Material icon name mapping
+LOCATION_TYPE_MATERIAL_ICONS: dict[LocationType, str] = {
+    LocationType.FROZEN: "ac_unit",
+    LocationType.CHILLED: "kitchen",
+    LocationType.AMBIENT: "home",
+}
+
+
 def get_location_type_icon(location_type: LocationType) -> str:
     """Get Material icon name for a location type.
 
@@ -18,12 +26,7 @@ def get_location_type_icon(location_type: LocationType) -> str:
     Returns:
         Material icon name string
     """
-    icons = {
-        LocationType.FROZEN: "ac_unit",
-        LocationType.CHILLED: "kitchen",
-        LocationType.AMBIENT: "home",
-    }
-    return icons.get(location_type, "inventory_2")
+    return LOCATION_TYPE_MATERIAL_ICONS.get(location_type, "inventory_2")
 
 
 def create_location_overview_chips(
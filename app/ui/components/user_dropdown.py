@@ -32,7 +32,9 @@ def create_user_dropdown() -> None:
         is_admin = Permission.CONFIG_MANAGE in permissions
 
     # Clickable username with dropdown
-    with ui.button(on_click=lambda: None).props("flat no-caps color=gray-7").classes("text-sm"):
+    with (
+        ui.button(on_click=lambda: None).props("flat no-caps color=gray-7").classes("text-sm").mark("user-menu-button")
+    ):
         with ui.row().classes("items-center gap-2"):
             create_icon("misc/user", size="20px")
             ui.label(username)
@@ -51,7 +53,7 @@ def create_user_dropdown() -> None:
                         ui.label("Einstellungen")
 
             # Logout option
-            with ui.menu_item(on_click=logout):
+            with ui.menu_item(on_click=logout).mark("logout-menu-item"):
                 with ui.row().classes("items-center gap-2"):
                     create_icon("misc/logout", size="20px")
                     ui.label("Abmelden")
@@ -22,14 +22,19 @@ from ..components import create_item_card
 from ..components import create_mobile_page_container
 from ..theme import get_contrast_text_color
 from ..theme.icons import create_icon
+from collections.abc import Callable
 from nicegui import app
 from nicegui import ui
+from operator import attrgetter
 from typing import Any
 
 
 # User storage key for consumed items filter (persisted across page reloads)
 SHOW_CONSUMED_KEY = "show_consumed_items"
 
+# Delay before search input changes are sent to the server (collapses per-keystroke refreshes)
+SEARCH_DEBOUNCE_MS = 300
+
 
 # Default filter state (used for reset functionality)
 DEFAULT_FILTER_STATE: dict[str, str | int | bool] = {
@@ -75,6 +80,19 @@ SORT_OPTIONS: dict[str, str] = {
     "created_at": "Erfassungsdatum",
 }
 
+
+def _product_name_sort_key(item: Item) -> str:
+    """Sort key for case-insensitive ordering by product name."""
+    return item.product_name.casefold()
+
+
+# Sort key per sort field (keys of SORT_OPTIONS)
+SORT_KEYS: dict[str, Callable[[Item], Any]] = {
+    "best_before_date": attrgetter("best_before_date"),
+    "product_name": _product_name_sort_key,
+    "created_at": attrgetter("created_at"),
+}
+
 # Human-readable labels for item types
 ITEM_TYPE_LABELS: dict[str, str] = {
     "": "Alle Typen",
@@ -85,6 +103,9 @@ ITEM_TYPE_LABELS: dict[str, str] = {
     ItemType.HOMEMADE_PRESERVED.value: "Eingemacht",
 }
 
+# Item type per filter value (keys of ITEM_TYPE_LABELS)
+_ITEM_TYPE_BY_VALUE: dict[str, ItemType] = {item_type.value: item_type for item_type in ItemType}
+
 
 def _render_empty_state() -> None:
     """Render empty state when no items exist or no search results."""
@@ -116,16 +137,19 @@ def _render_no_consumed_items() -> None:
         ui.label("Es wurden noch keine Artikel entnommen.").classes("text-sm text-stone")
 
 
-def _build_item_category_map(items: list[Item]) -> dict[int, int | None]:
-    """Build a mapping from item IDs to their category ID.
+def _build_item_name_map(items: list[Item]) -> dict[int, str]:
+    """Build a mapping from item IDs to their case-folded product name.
+
+    Built once per item load so the search filter does not fold every
+    product name again on each keystroke.
 
     Args:
         items: List of items
 
     Returns:
-        Dictionary mapping item ID to category ID (or None)
+        Dictionary mapping item ID to case-folded product name
     """
-    return {item.id: item.category_id for item in items if item.id is not None}
+    return {item.id: item.product_name.casefold() for item in items if item.id is not None}
 
 
 def _filter_items(
@@ -133,75 +157,75 @@ def _filter_items(
     search_term: str,
     location_id: int | None = None,
     item_type: str | None = None,
+    name_map: dict[int, str] | None = None,
+    categories: set[int] | None = None,
 ) -> list[Item]:
-    """Filter items by product name, location, and item type.
+    """Filter items by product name, location, item type, and categories.
+
+    All filters are applied in a single pass. Cheap comparisons run first,
+    the substring search on the product name last. Without any active
+    filter the input list is returned as is.
 
     Args:
         items: List of items to filter
         search_term: Search term to filter by (case-insensitive)
         location_id: Location ID to filter by (None or 0 = all locations)
         item_type: Item type value to filter by (None or "" = all types)
+        name_map: Optional mapping of item IDs to case-folded product names
+            (see _build_item_name_map); names are folded on the fly if missing
+        categories: Category IDs to filter by, OR logic (None or empty = all categories)
 
     Returns:
         Filtered list of items
     """
-    result = items
-
-    # Filter by search term
-    if search_term:
-        term_lower = search_term.lower()
-        result = [item for item in result if term_lower in item.product_name.lower()]
-
-    # Filter by location
-    if location_id and location_id > 0:
-        result = [item for item in result if item.location_id == location_id]
-
-    # Filter by item type
-    if item_type:
-        result = [item for item in result if item.item_type.value == item_type]
-
-    return result
-
-
-def _filter_items_by_categories(
-    items: list[Item],
-    selected_categories: set[int],
-    item_category_map: dict[int, int | None],
-) -> list[Item]:
-    """Filter items by selected categories (OR logic).
-
-    Args:
-        items: List of items to filter
-        selected_categories: Set of selected category IDs
-        item_category_map: Mapping of item IDs to category ID
-
-    Returns:
-        Filtered list of items that have one of the selected categories
-    """
-    if not selected_categories:
+    if not search_term and not location_id and not item_type and not categories:
         return items
 
-    return [item for item in items if item.id is not None and item_category_map.get(item.id) in selected_categories]
+    needle = search_term.casefold() if search_term else ""
+    location_filter = location_id if location_id and location_id > 0 else None
+    type_filter = _ITEM_TYPE_BY_VALUE.get(item_type) if item_type else None
+    if item_type and type_filter is None:
+        return []
+
+    result: list[Item] = []
+    for item in items:
+        if location_filter is not None and item.location_id != location_filter:
+            continue
+        if type_filter is not None and item.item_type is not type_filter:
+            continue
+        if categories and item.category_id not in categories:
+            continue
+        if needle:
+            name = (
+                name_map.get(item.id) if name_map is not None and item.id is not None else None
+            ) or item.product_name.casefold()
+            if needle not in name:
+                continue
+        result.append(item)
+    return result
 
 
-def _sort_items(items: list[Item], sort_field: str, ascending: bool) -> list[Item]:
+def _sort_items(items: list[Item], sort_field: str, ascending: bool, inplace: bool = False) -> list[Item]:
     """Sort items by the specified field.
 
     Args:
         items: List of items to sort
         sort_field: Field to sort by (best_before_date, product_name, created_at)
         ascending: True for ascending, False for descending
+        inplace: Sort the given list itself instead of a copy (only for
+            lists the caller owns, e.g. a fresh result of _filter_items)
 
     Returns:
-        Sorted list of items
+        Sorted list of items (the input list itself for an unknown sort
+        field or fewer than two items)
     """
-    if sort_field == "best_before_date":
-        return sorted(items, key=lambda x: x.best_before_date, reverse=not ascending)
-    elif sort_field == "product_name":
-        return sorted(items, key=lambda x: x.product_name.lower(), reverse=not ascending)
-    elif sort_field == "created_at":
-        return sorted(items, key=lambda x: x.created_at, reverse=not ascending)
-    return items
+    sort_key = SORT_KEYS.get(sort_field)
+    if sort_key is None or len(items) < 2:
+        return items
+    if inplace:
+        items.sort(key=sort_key, reverse=not ascending)
+        return items
+    return sorted(items, key=sort_key, reverse=not ascending)
 
 
 @ui.page("/items")
@@ -253,62 +277,77 @@ def items_page(filter: str | None = None, location: int | None = None) -> None:
     # Container reference (for refreshing)
     items_container: Any = None
 
+    # Items of the last database load, reused while only filters or sorting change
+    loaded_items: list[Item] = []
+    loaded_name_map: dict[int, str] = {}
+
     # Load locations for filter dropdown
     with next(get_session()) as session:
         locations = location_service.get_all_locations(session)
         location_options: dict[int, str] = {0: "Alle Lagerorte"}
         location_options.update({loc.id: loc.name for loc in locations if loc.id is not None})
 
-    def refresh_items() -> None:
-        """Refresh items list based on current filter settings."""
-        nonlocal items_container
+    def refresh_items(reload: bool = True) -> None:
+        """Refresh items list based on current filter settings.
+
+        Args:
+            reload: Load the items from the database again. Pass False when
+                only filters or sorting changed to reuse the last load.
+        """
+        nonlocal items_container, loaded_items, loaded_name_map
         if items_container is None:
             return
 
         items_container.clear()
 
-        with items_container:
+        if reload:
             with next(get_session()) as session:
                 # Get items based on consumed filter (use local state for immediate updates)
                 if filter_state["show_consumed"]:
                     # Show only consumed/partially withdrawn items, sorted by last withdrawal
-                    all_items = item_service.get_consumed_items(session)
+                    loaded_items = item_service.get_consumed_items(session)
                 elif filter_state.get("expiring_only"):
                     # Show only items expiring in next 7 days (Issue #244)
-                    all_items = item_service.get_items_expiring_soon(session, days=7)
+                    loaded_items = item_service.get_items_expiring_soon(session, days=7)
                 else:
-                    all_items = item_service.get_active_items(session)
+                    loaded_items = item_service.get_active_items(session)
 
-                # Build item-to-category mapping
-                item_category_map = _build_item_category_map(all_items)
+            # Build item-to-search-name mapping once per load
+            loaded_name_map = _build_item_name_map(loaded_items)
 
-                # Apply all filters (search, location, item type)
-                filtered_items = _filter_items(
-                    all_items,
-                    filter_state["search_term"],
-                    filter_state["location_id"],
-                    filter_state["item_type"],
-                )
+        all_items = loaded_items
+
+        # Apply all filters (search, location, item type, categories) in one pass
+        filtered_items = _filter_items(
+            all_items,
+            filter_state["search_term"],
+            filter_state["location_id"],
+            filter_state["item_type"],
+            loaded_name_map,
+            selected_categories,
+        )
+
+        # Apply sorting (skip when showing consumed - already sorted by withdrawal date)
+        # A filtered list is a fresh copy and can be sorted in place
+        if not filter_state["show_consumed"]:
+            filtered_items = _sort_items(
+                filtered_items,
+                filter_state["sort_field"],
+                filter_state["sort_ascending"],
+                inplace=filtered_items is not all_items,
+            )
 
-                # Apply category filter
-                filtered_items = _filter_items_by_categories(filtered_items, selected_categories, item_category_map)
-
-                # Apply sorting (skip when showing consumed - already sorted by withdrawal date)
-                if not filter_state["show_consumed"]:
-                    filtered_items = _sort_items(
-                        filtered_items,
-                        filter_state["sort_field"],
-                        filter_state["sort_ascending"],
-                    )
-
-                if not all_items:
-                    # No items - show appropriate empty state
-                    if filter_state["show_consumed"]:
-                        _render_no_consumed_items()
-                    else:
-                        _render_empty_state()
-                elif filtered_items:
-                    # Display filtered items as cards with consume button and swipe actions
+        with items_container:
+            if not all_items:
+                # No items - show appropriate empty state
+                if filter_state["show_consumed"]:
+                    _render_no_consumed_items()
+                else:
+                    _render_empty_state()
+            elif filtered_items:
+                # Display filtered items as cards with consume button and swipe actions
+                # (cards look up location, category and initial quantity)
+                with next(get_session()) as session:
                     for item in filtered_items:
                         create_item_card(
                             item,
@@ -318,9 +357,9 @@ def items_page(filter: str | None = None, location: int | None = None) -> None:
                             on_consume_all=handle_consume_all,  # Swipe "Alles" -> consume all
                             on_edit=lambda i=item: ui.navigate.to(f"/items/{i.id}/edit"),
                         )
-                else:
-                    # Filters yielded no results
-                    _render_no_filter_results()
+            else:
+                # Filters yielded no results
+                _render_no_filter_results()
 
     def on_toggle_change(e: Any) -> None:
         """Handle toggle change - update local state and persist to user storage."""
@@ -335,25 +374,25 @@ def items_page(filter: str | None = None, location: int | None = None) -> None:
         """Handle search input change."""
         filter_state["search_term"] = e.value or ""
         update_reset_button_visibility()
-        refresh_items()
+        refresh_items(reload=False)
 
     def on_location_change(e: Any) -> None:
         """Handle location filter change."""
         filter_state["location_id"] = e.value if e.value else 0
         update_reset_button_visibility()
-        refresh_items()
+        refresh_items(reload=False)
 
     def on_item_type_change(e: Any) -> None:
         """Handle item type filter change."""
         filter_state["item_type"] = e.value if e.value else ""
         update_reset_button_visibility()
-        refresh_items()
+        refresh_items(reload=False)
 
     def on_sort_field_change(e: Any) -> None:
         """Handle sort field change."""
         filter_state["sort_field"] = e.value if e.value else "best_before_date"
         update_reset_button_visibility()
-        refresh_items()
+        refresh_items(reload=False)
 
     def toggle_sort_direction() -> None:
         """Toggle between ascending and descending sort."""
@@ -364,7 +403,7 @@ def items_page(filter: str | None = None, location: int | None = None) -> None:
             new_icon = "arrow_upward" if filter_state["sort_ascending"] else "arrow_downward"
             sort_direction_btn.props(f"icon={new_icon}")
         update_reset_button_visibility()
-        refresh_items()
+        refresh_items(reload=False)
 
     def update_reset_button_visibility() -> None:
         """Update visibility of reset button based on active filters."""
@@ -432,7 +471,7 @@ def items_page(filter: str | None = None, location: int | None = None) -> None:
             selected_categories.add(cat_id)
         update_chip_style(cat_id)
         update_reset_button_visibility()
-        refresh_items()
+        refresh_items(reload=False)
 
     def handle_consume(item: Item) -> None:
         """Handle consume button click - opens bottom sheet with item details."""
@@ -471,7 +510,8 @@ def items_page(filter: str | None = None, location: int | None = None) -> None:
                     placeholder="Produktname...",
                     on_change=on_search_change,
                 )
-                .props("clearable dense outlined")
+                .props(f"clearable dense outlined debounce={SEARCH_DEBOUNCE_MS}")
+                .mark("search-input")
                 .classes("w-full")
             )
 
@@ -111,6 +111,9 @@ def locations_page() -> None:
                                 ui.badge("Inaktiv", color="red").classes("text-xs")
                             # Action buttons (Solarpunk theme)
                             with ui.row().classes("sp-admin-actions items-center gap-1"):
+                                location_id = location.id
+                                assert location_id is not None  # Loaded from DB
+                                location_name = location.name
                                 # Edit button
                                 with (
                                     ui.button(
@@ -118,13 +121,10 @@ def locations_page() -> None:
                                     )
                                     .props("flat round size=sm")
                                     .classes("edit min-w-0")
-                                    .mark("edit")
+                                    .mark(f"edit-{location_name}")
                                 ):
                                     create_icon("actions/edit", size="20px")
                                 # Delete button
-                                location_id = location.id
-                                assert location_id is not None  # Loaded from DB
-                                location_name = location.name
                                 with (
                                     ui.button(
                                         on_click=lambda lid=location_id, ln=location_name: _open_delete_dialog(lid, ln),
@@ -14,6 +14,7 @@ from ...models.user import Role
 from ...services import auth_service
 from ..components import create_mobile_page_container
 from ..theme.icons import create_icon
+from ..validation import validate_user_form
 from nicegui import ui
 
 
@@ -186,27 +187,9 @@ def _open_create_dialog() -> None:
                 password_confirm = password_confirm_input.value if password_confirm_input.value else ""
                 role_value = role_select.value
 
-                # Validation: username is required
-                if not username:
-                    error_label.set_text("Benutzername ist erforderlich")
-                    error_label.set_visibility(True)
-                    return
-
-                # Validation: email is required
-                if not email:
-                    error_label.set_text("E-Mail ist erforderlich")
-                    error_label.set_visibility(True)
-                    return
-
-                # Validation: password is required
-                if not password:
-                    error_label.set_text("Passwort ist erforderlich")
-                    error_label.set_visibility(True)
-                    return
-
-                # Validation: passwords must match
-                if password != password_confirm:
-                    error_label.set_text("Passwörter stimmen nicht überein")
+                # Validation: username, email and password required, passwords must match
+                if error := validate_user_form(username, email, password, password_confirm):
+                    error_label.set_text(error)
                     error_label.set_visibility(True)
                     return
 
@@ -318,21 +301,9 @@ def _open_edit_dialog(
                 password = password_input.value if password_input.value else ""
                 password_confirm = password_confirm_input.value if password_confirm_input.value else ""
 
-                # Validation: username is required
-                if not username:
-                    error_label.set_text("Benutzername ist erforderlich")
-                    error_label.set_visibility(True)
-                    return
-
-                # Validation: email is required
-                if not email:
-                    error_label.set_text("E-Mail ist erforderlich")
-                    error_label.set_visibility(True)
-                    return
-
-                # Validation: if password provided, confirmation must match
-                if password and password != password_confirm:
-                    error_label.set_text("Passwörter stimmen nicht überein")
+                # Validation: username and email required, password optional but must match
+                if error := validate_user_form(username, email, password, password_confirm, password_required=False):
+                    error_label.set_text(error)
                     error_label.set_visibility(True)
                     return
 
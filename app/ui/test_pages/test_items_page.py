@@ -9,6 +9,7 @@ from ...models.item import Item
 from ...models.item import ItemType
 from ...models.location import Location
 from ...models.location import LocationType
+from ...services import auth_service
 from ..components import create_bottom_nav
 from ..components import create_item_card
 from datetime import date
@@ -129,11 +130,11 @@ def _create_test_item_with_type(
     return item
 
 
-def _set_test_session() -> None:
-    """Set test user session."""
+def _set_test_session(user_id: int = 1, username: str = "admin") -> None:
+    """Set test user session (default: admin user)."""
     app.storage.user["authenticated"] = True
-    app.storage.user["user_id"] = 1
-    app.storage.user["username"] = "admin"
+    app.storage.user["user_id"] = user_id
+    app.storage.user["username"] = username
 
 
 def _set_item_category(session: Session, item_id: int, category_id: int) -> None:
@@ -161,6 +162,21 @@ def page_test_login_admin(next: str = "") -> None:
         ui.label("Willkommen")
 
 
+@ui.page("/test-login-user/{username}")
+def page_test_login_user(username: str) -> None:
+    """Test page to simulate login as an existing user without the login form.
+
+    Args:
+        username: Username of a user that exists in the test database.
+    """
+    with next(get_session()) as session:
+        user = auth_service.get_user_by_username(session, username)
+        assert user is not None and user.id is not None, f"Test user {username!r} does not exist"
+        _set_test_session(user.id, user.username)
+
+    ui.label(f"Angemeldet als {username}")
+
+
 @ui.page("/test-items-page-with-items")
 def page_items_with_items() -> None:
     """Test page with items displayed as cards."""
@@ -1,5 +1,6 @@
 """Validation Package for UI Forms."""
 
+from .user_validation import validate_user_form
 from .wizard_validation import is_step1_valid
 from .wizard_validation import is_step2_valid
 from .wizard_validation import is_step3_valid
@@ -33,4 +34,5 @@ __all__ = [
     "validate_step2",
     "validate_step3",
     "validate_unit",
+    "validate_user_form",
 ]
@@ -0,0 +1,35 @@
+"""Validation logic for User create/edit dialogs."""
+
+
+def validate_user_form(
+    username: str,
+    email: str,
+    password: str,
+    password_confirm: str,
+    password_required: bool = True,
+) -> str | None:
+    """Validate the user dialog fields.
+
+    Args:
+        username: Username input (stripped)
+        email: Email input (stripped)
+        password: Password input
+        password_confirm: Password confirmation input
+        password_required: False when editing, where an empty password keeps the current one
+
+    Returns:
+        First error message if invalid, None if valid
+    """
+    if not username:
+        return "Benutzername ist erforderlich"
+
+    if not email:
+        return "E-Mail ist erforderlich"
+
+    if password_required and not password:
+        return "Passwort ist erforderlich"
+
+    if password and password != password_confirm:
+        return "Passwörter stimmen nicht überein"
+
+    return None
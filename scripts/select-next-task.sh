@@ -15,6 +15,7 @@
 #
 
 set -e
+shopt -s extglob
 
 # Farben für bessere Lesbarkeit
 RED='\033[0;31m'
@@ -40,9 +41,9 @@ print_section() {
 
 # Funktion: Alle agent-ready Issues laden (ohne blockierte!)
 get_ready_issues() {
-    # Hole agent-ready Issues und filtere blockierte heraus
-    gh issue list --repo "$REPO" --label "status/agent-ready" --state open --json number,title,labels --limit 50 | \
-        jq '[.[] | select(.labels | map(.name) | index("status/blocked") | not)]'
+    # Hole agent-ready Issues, blockierte filtert GitHub direkt heraus
+    gh issue list --repo "$REPO" --state open --search 'label:"status/agent-ready" -label:"status/blocked"' \
+        --json number,title --limit 50
 }
 
 # Funktion: Alle in-progress Issues laden
@@ -60,19 +61,26 @@ show_issue_details() {
 # Funktion: Abhängige Issues dynamisch finden (sucht "Blocked by #X" in Issue-Bodies)
 find_dependents() {
     local issue_num=$1
-    # Suche alle offenen Issues die "Blocked by #<issue_num>" im Body haben
-    gh issue list --repo "$REPO" --state open --json number,title,body --limit 100 | \
+    # Suche alle offenen Issues die "Blocked by #<issue_num>" im Body haben.
+    # Die GitHub-Suche grenzt serverseitig vor (ignoriert Satzzeichen wie # und :),
+    # jq prüft danach exakt - statt alle offenen Issues mit Body zu laden.
+    gh issue list --repo "$REPO" --state open --search "\"blocked by\" $issue_num in:body" --json number,title,body --limit 100 | \
         jq -r --arg num "$issue_num" '.[] | select(.body != null) | select(.body | test("(?i)blocked\\s+by:?\\s*#" + $num + "\\b")) | "\(.number)\t\(.title)"'
 }
 
 # Funktion: Abhängige Issues anzeigen
+# Optional $2: bereits ermittelte Ausgabe von find_dependents (spart die erneute Suche)
 show_dependents() {
     local issue_num=$1
 
     print_section "Abhängige Issues (werden nach Abschluss freigeschaltet)"
 
     local deps
-    deps=$(find_dependents "$issue_num")
+    if [ $# -ge 2 ]; then
+        deps=$2
+    else
+        deps=$(find_dependents "$issue_num")
+    fi
 
     if [ -n "$deps" ]; then
         echo "$deps" | while IFS=$'\t' read -r dep_num dep_title; do
@@ -88,8 +96,12 @@ show_dependents() {
 generate_briefing() {
     local issue_num=$1
     local issue_title=$2
-    local branch_suffix
-    branch_suffix=$(echo "$issue_title" | tr '[:upper:]' '[:lower:]' | sed 's/[^a-z0-9]/-/g' | sed 's/--*/-/g' | head -c 20)
+    # Branch-Suffix per Bash-Parameter-Expansion (ohne tr/sed/head-Prozesse):
+    # klein, Sonderzeichen → "-", Folgen von "-" zusammenfassen, max. 20 Zeichen
+    local branch_suffix="${issue_title,,}"
+    branch_suffix="${branch_suffix//[^a-z0-9]/-}"
+    branch_suffix="${branch_suffix//+(-)/-}"
+    branch_suffix="${branch_suffix:0:20}"
     # Worktree im Unterordner worktrees/ (gitignored)
     local worktree_abs
     worktree_abs="$(pwd)/worktrees/issue-$issue_num"
@@ -147,16 +159,17 @@ update_labels() {
 
     echo -e "\n${YELLOW}Aktualisiere Labels...${NC}"
 
-    # agent-ready entfernen
-    gh issue edit "$issue_num" --repo "$REPO" --remove-label "status/agent-ready" 2>/dev/null || true
-    echo -e "${GREEN}✓ Label 'status/agent-ready' entfernt${NC}"
-
-    # in-progress hinzufügen (mit Fehlerprüfung)
-    if gh issue edit "$issue_num" --repo "$REPO" --add-label "status/in-progress" 2>/dev/null; then
+    # agent-ready entfernen und in-progress hinzufügen in einem Aufruf (mit Fehlerprüfung,
+    # stderr von gh wird für die Fehlermeldung aufgehoben statt verworfen)
+    local gh_error
+    if gh_error=$(gh issue edit "$issue_num" --repo "$REPO" \
+        --remove-label "status/agent-ready" --add-label "status/in-progress" 2>&1 >/dev/null); then
+        echo -e "${GREEN}✓ Label 'status/agent-ready' entfernt${NC}"
         echo -e "${GREEN}✓ Label 'status/in-progress' hinzugefügt${NC}"
     else
-        echo -e "${RED}✗ FEHLER: Label 'status/in-progress' konnte nicht gesetzt werden!${NC}"
-        echo -e "${YELLOW}  Bitte manuell erstellen: gh label create 'status/in-progress' --color 'FBCA04'${NC}"
+        echo -e "${RED}✗ FEHLER: Labels konnten nicht aktualisiert werden (Issue bleibt agent-ready)!${NC}"
+        echo -e "${RED}  $gh_error${NC}"
+        echo -e "${YELLOW}  Fehlt das Label 'status/in-progress'? Bitte manuell erstellen: gh label create 'status/in-progress' --color 'FBCA04'${NC}"
     fi
 }
 
@@ -259,7 +272,10 @@ main_menu() {
         show_issue_details "$selection"
 
         echo ""
-        show_dependents "$selection"
+        # Abhängige Issues nur einmal suchen, sie werden nach dem Zuweisen erneut angezeigt
+        local dependents
+        dependents=$(find_dependents "$selection")
+        show_dependents "$selection" "$dependents"
 
         # Frage ob zuweisen
         echo -e "${BOLD}Möchtest du dieses Issue einem Agenten zuweisen?${NC}"
@@ -286,7 +302,7 @@ main_menu() {
                 echo ""
 
                 # Abhängige Issues nochmal zeigen
-                show_dependents "$selection"
+                show_dependents "$selection" "$dependents"
 
                 print_section "Nach Abschluss"
                 echo -e "Wenn das Issue fertig ist und der PR gemerged wurde:"
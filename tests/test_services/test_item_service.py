@@ -1,5 +1,6 @@
 """Tests for item_service."""
 
+from app.models import Item
 from app.models import ItemType
 from app.models import LocationType
 from app.models import User
@@ -9,7 +10,9 @@ from app.services import location_service
 from datetime import date
 from datetime import timedelta
 import pytest
+from sqlalchemy import text
 from sqlmodel import Session
+from sqlmodel import select
 
 
 def test_get_all_items(session: Session, test_admin: User) -> None:
@@ -303,6 +306,20 @@ def test_get_items_expiring_soon(session: Session, test_admin: User) -> None:
     assert items[0].product_name == "Joghurt"
 
 
+def test_expiring_soon_query_uses_best_before_date_index(session: Session) -> None:
+    """Test that the expiring-soon query is answered via the best_before_date index."""
+    cutoff = date.today() + timedelta(days=7)
+    statement = select(Item).where(
+        Item.best_before_date <= cutoff,
+        Item.is_consumed.is_(False),  # type: ignore
+    )
+    sql = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+
+    plan = session.connection().execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+    assert any("ix_item_best_before_date" in row[-1] for row in plan)
+
+
 # =============================================================================
 # Partial Withdrawal Tests (Issue #16)
 # =============================================================================
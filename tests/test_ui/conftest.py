@@ -1,6 +1,19 @@
 """UI-Test spezifische Konfiguration.
 
 NiceGUI Testing Plugin wird nur hier geladen, nicht für Unit Tests.
+Alle Tests in diesem Verzeichnis bekommen den Marker `ui`, damit sie bei
+schneller lokaler Iteration mit `-m "not ui"` ausgelassen werden können.
 """
 
+import pytest
+
+
 pytest_plugins = ["nicegui.testing.plugin"]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark all tests in this directory as ui."""
+    for item in items:
+        # Only mark tests in this directory
+        if "test_ui" in str(item.fspath):
+            item.add_marker(pytest.mark.ui)
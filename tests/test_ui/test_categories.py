@@ -7,7 +7,6 @@ Issue #23: Kategorie löschen
 """
 
 from app.models.category import Category
-from app.models.user import User
 from nicegui.testing import User as TestUser
 from sqlmodel import Session
 
@@ -44,37 +43,17 @@ async def test_categories_page_displays_categories(
     await logged_in_user.should_see("Fleisch")
 
 
-async def test_categories_page_requires_auth(user: TestUser) -> None:
-    """Test that unauthenticated users are redirected to login."""
-    # Try to access categories without login
-    await user.open("/admin/categories")
-
-    # Should be redirected to login
-    await user.should_see("Anmelden")
-
-
 async def test_categories_page_requires_admin_permission(
     user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that regular users are redirected (no CONFIG_MANAGE permission)."""
     # Create a regular user
-    with Session(isolated_test_database) as session:
-        regular_user = User(
-            username="testuser",
-            email="testuser@example.com",
-            is_active=True,
-            role="user",
-        )
-        regular_user.set_password("password123")
-        session.add(regular_user)
-        session.commit()
+    create_test_user("testuser")
 
-    # Login as regular user (manual login needed for non-admin user)
-    await user.open("/login")
-    user.find("Benutzername").type("testuser")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
+    # Login as regular user (session set directly, no login form)
+    await user.open("/test-login-user/testuser")
+    await user.should_see("Angemeldet als testuser")
 
     # Try to navigate to categories page
     await user.open("/admin/categories")
@@ -89,86 +68,62 @@ async def test_categories_page_requires_admin_permission(
 # =============================================================================
 
 
-async def test_categories_page_has_new_category_button(user: TestUser) -> None:
+async def test_categories_page_has_new_category_button(logged_in_user: TestUser) -> None:
     """Test that categories page has 'Neue Kategorie' button."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Should see "Neue Kategorie" button
-    await user.should_see("Neue Kategorie")
+    await logged_in_user.should_see("Neue Kategorie")
 
 
-async def test_new_category_button_opens_dialog(user: TestUser) -> None:
+async def test_new_category_button_opens_dialog(logged_in_user: TestUser) -> None:
     """Test that clicking 'Neue Kategorie' opens a dialog with form."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button (using marker for custom icon button)
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Should see dialog with form fields
-    await user.should_see("Neue Kategorie erstellen")
-    await user.should_see("Name")
+    await logged_in_user.should_see("Neue Kategorie erstellen")
+    await logged_in_user.should_see("Name")
 
 
-async def test_create_category_success(user: TestUser, isolated_test_database) -> None:
+async def test_create_category_success(logged_in_user: TestUser, isolated_test_database) -> None:
     """Test that creating a category works correctly."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button (using marker for custom icon button)
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Fill in the form
-    user.find("Name").type("Gemüse")
+    logged_in_user.find("Name").type("Gemüse")
 
     # Click save
-    user.find("Speichern").click()
+    logged_in_user.find("Speichern").click()
 
     # Should see success notification and category in list
-    await user.should_see("Gemüse")
+    await logged_in_user.should_see("Gemüse")
 
 
-async def test_create_category_validation_name_required(user: TestUser) -> None:
+async def test_create_category_validation_name_required(logged_in_user: TestUser) -> None:
     """Test that category name is required."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Try to save without entering name
-    user.find("Speichern").click()
+    logged_in_user.find("Speichern").click()
 
     # Should see error message
-    await user.should_see("Name ist erforderlich")
+    await logged_in_user.should_see("Name ist erforderlich")
 
 
-async def test_create_category_validation_unique_name(user: TestUser, isolated_test_database) -> None:
+async def test_create_category_validation_unique_name(logged_in_user: TestUser, isolated_test_database) -> None:
     """Test that duplicate category names are rejected."""
     # Create a category first
     with Session(isolated_test_database) as session:
@@ -179,24 +134,18 @@ async def test_create_category_validation_unique_name(user: TestUser, isolated_t
         session.add(cat)
         session.commit()
 
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Try to create category with duplicate name
-    user.find("Name").type("Fleisch")
-    user.find("Speichern").click()
+    logged_in_user.find("Name").type("Fleisch")
+    logged_in_user.find("Speichern").click()
 
     # Should see error message about duplicate
-    await user.should_see("bereits vorhanden")
+    await logged_in_user.should_see("bereits vorhanden")
 
 
 # =============================================================================
@@ -574,81 +523,63 @@ async def test_edit_dialog_shows_existing_shelf_life(
 # =============================================================================
 
 
-async def test_create_dialog_shows_shelf_life_section(user: TestUser) -> None:
+async def test_create_dialog_shows_shelf_life_section(logged_in_user: TestUser) -> None:
     """Test that create dialog shows shelf life configuration section."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Should see shelf life section
-    await user.should_see("Haltbarkeit")
-    await user.should_see("Gefroren")
-    await user.should_see("Gekühlt")
-    await user.should_see("Raumtemperatur")
+    await logged_in_user.should_see("Haltbarkeit")
+    await logged_in_user.should_see("Gefroren")
+    await logged_in_user.should_see("Gekühlt")
+    await logged_in_user.should_see("Raumtemperatur")
 
 
-async def test_create_dialog_has_min_max_fields(user: TestUser) -> None:
+async def test_create_dialog_has_min_max_fields(logged_in_user: TestUser) -> None:
     """Test that create dialog has min and max input fields for shelf life."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Should see Min/Max labels
-    await user.should_see("Min")
-    await user.should_see("Max")
-    await user.should_see("Quelle")
+    await logged_in_user.should_see("Min")
+    await logged_in_user.should_see("Max")
+    await logged_in_user.should_see("Quelle")
 
 
 async def test_create_category_with_shelf_life(
-    user: TestUser,
+    logged_in_user: TestUser,
     isolated_test_database,
 ) -> None:
     """Test that creating a category with shelf life works correctly."""
     from app.models.category_shelf_life import CategoryShelfLife
     from app.models.category_shelf_life import StorageType
 
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Fill in the form
-    user.find("Name").type("Fleisch")
+    logged_in_user.find("Name").type("Fleisch")
 
     # Set shelf life values for frozen
-    frozen_min = user.find(marker="create-frozen-min")
-    frozen_max = user.find(marker="create-frozen-max")
+    frozen_min = logged_in_user.find(marker="create-frozen-min")
+    frozen_max = logged_in_user.find(marker="create-frozen-max")
     list(frozen_min.elements)[0].value = 6
     list(frozen_max.elements)[0].value = 12
 
     # Click save
-    user.find("Speichern").click()
+    logged_in_user.find("Speichern").click()
 
     # Should see category in list
-    await user.should_see("Fleisch")
+    await logged_in_user.should_see("Fleisch")
 
     # Verify shelf life was saved in database
     with Session(isolated_test_database) as session:
@@ -669,35 +600,29 @@ async def test_create_category_with_shelf_life(
 
 
 async def test_create_category_shelf_life_validation_min_greater_than_max(
-    user: TestUser,
+    logged_in_user: TestUser,
 ) -> None:
     """Test validation error when min > max in create dialog."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Fill in the form
-    user.find("Name").type("Obst")
+    logged_in_user.find("Name").type("Obst")
 
     # Set invalid shelf life values (min > max)
-    frozen_min = user.find(marker="create-frozen-min")
-    frozen_max = user.find(marker="create-frozen-max")
+    frozen_min = logged_in_user.find(marker="create-frozen-min")
+    frozen_max = logged_in_user.find(marker="create-frozen-max")
     list(frozen_min.elements)[0].value = 12
     list(frozen_max.elements)[0].value = 6
 
     # Click save
-    user.find("Speichern").click()
+    logged_in_user.find("Speichern").click()
 
     # Should see validation error
-    await user.should_see("Min muss <= Max sein")
+    await logged_in_user.should_see("Min muss <= Max sein")
 
 
 # =============================================================================
@@ -705,48 +630,36 @@ async def test_create_category_shelf_life_validation_min_greater_than_max(
 # =============================================================================
 
 
-async def test_create_dialog_shows_color_preview(user: TestUser) -> None:
+async def test_create_dialog_shows_color_preview(logged_in_user: TestUser) -> None:
     """Test that create dialog shows a color preview element."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Should see color preview element (marker: color-preview)
-    preview = user.find(marker="color-preview")
+    preview = logged_in_user.find(marker="color-preview")
     assert preview is not None
 
 
 async def test_create_dialog_color_preview_updates_on_selection(
-    user: TestUser,
+    logged_in_user: TestUser,
 ) -> None:
     """Test that color preview updates when color is selected."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to categories page
-    await user.open("/admin/categories")
+    # Navigate to categories page (already logged in via fixture)
+    await logged_in_user.open("/admin/categories")
 
     # Click the "Neue Kategorie" button
-    user.find(marker="new-category-button").click()
+    logged_in_user.find(marker="new-category-button").click()
 
     # Find color input and set a value
-    color_input = user.find(marker="color-input")
+    color_input = logged_in_user.find(marker="color-input")
     # Set a color value directly on the element
     list(color_input.elements)[0].value = "#FF5733"
 
     # The preview should reflect the color
-    preview = user.find(marker="color-preview")
+    preview = logged_in_user.find(marker="color-preview")
     preview_element = list(preview.elements)[0]
     # Check that the style contains the color
     assert "background" in preview_element._style or preview_element._style.get("background-color") == "#FF5733"
@@ -10,13 +10,6 @@ from nicegui.testing import User
 from sqlmodel import Session
 
 
-async def test_edit_item_route_requires_auth(user: User) -> None:
-    """Test that /items/1/edit requires authentication."""
-    await user.open("/items/1/edit")
-    # Should redirect to login
-    await user.should_see("Benutzername")
-
-
 async def test_edit_item_page_shows_form(logged_in_user: User, isolated_test_database) -> None:
     """Test that edit page shows a form with item fields."""
     # Create test data in the isolated database
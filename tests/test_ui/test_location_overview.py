@@ -8,27 +8,11 @@ from app.models.item import Item
 from app.models.item import ItemType
 from app.models.location import Location
 from app.models.location import LocationType
-from app.ui.components.location_overview import get_location_type_icon
 from datetime import date
 from nicegui.testing import User
 from sqlmodel import Session
 
 
-def test_get_location_type_icon_frozen() -> None:
-    """Test that FROZEN locations get ac_unit icon."""
-    assert get_location_type_icon(LocationType.FROZEN) == "ac_unit"
-
-
-def test_get_location_type_icon_chilled() -> None:
-    """Test that CHILLED locations get kitchen icon."""
-    assert get_location_type_icon(LocationType.CHILLED) == "kitchen"
-
-
-def test_get_location_type_icon_ambient() -> None:
-    """Test that AMBIENT locations get home icon."""
-    assert get_location_type_icon(LocationType.AMBIENT) == "home"
-
-
 async def test_location_overview_page_loads(user: User) -> None:
     """Test that location overview test page loads."""
     await user.open("/test/location-overview")
@@ -62,9 +46,9 @@ async def test_location_overview_shows_item_count(user: User, isolated_test_data
         session.commit()
         session.refresh(location)
 
-        # Create test items
-        for i in range(3):
-            item = Item(
+        # Create test items (one batched INSERT on commit)
+        session.add_all(
+            Item(
                 product_name=f"Item {i}",
                 best_before_date=date.today(),
                 quantity=100,
@@ -73,7 +57,8 @@ async def test_location_overview_shows_item_count(user: User, isolated_test_data
                 location_id=location.id,
                 created_by=1,
             )
-            session.add(item)
+            for i in range(3)
+        )
         session.commit()
 
     await user.open("/test/location-overview")
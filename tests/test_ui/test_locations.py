@@ -2,7 +2,6 @@
 
 from app.models.location import Location
 from app.models.location import LocationType
-from app.models.user import User
 from nicegui.testing import User as TestUser
 from sqlmodel import Session
 
@@ -54,37 +53,17 @@ async def test_locations_page_shows_location_types(
     await logged_in_user.should_see("Gekühlt")
 
 
-async def test_locations_page_requires_auth(user: TestUser) -> None:
-    """Test that unauthenticated users are redirected to login."""
-    # Try to access locations without login
-    await user.open("/admin/locations")
-
-    # Should be redirected to login
-    await user.should_see("Anmelden")
-
-
 async def test_locations_page_requires_admin_permission(
     user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that regular users are redirected (no CONFIG_MANAGE permission)."""
     # Create a regular user
-    with Session(isolated_test_database) as session:
-        regular_user = User(
-            username="testuser",
-            email="testuser@example.com",
-            is_active=True,
-            role="user",
-        )
-        regular_user.set_password("password123")
-        session.add(regular_user)
-        session.commit()
+    create_test_user("testuser")
 
-    # Login as regular user (manual login needed for non-admin user)
-    await user.open("/login")
-    user.find("Benutzername").type("testuser")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
+    # Login as regular user (session set directly, no login form)
+    await user.open("/test-login-user/testuser")
+    await user.should_see("Angemeldet als testuser")
 
     # Try to navigate to locations page
     await user.open("/admin/locations")
@@ -136,8 +115,8 @@ async def test_locations_page_shows_edit_button(
     # Should see the location
     await logged_in_user.should_see("Tiefkühler")
 
-    # Should have an edit button (icon button with 'edit' icon)
-    edit_button = logged_in_user.find("edit")
+    # Should have an edit button (via marker)
+    edit_button = logged_in_user.find(marker="edit-Tiefkühler")
     assert edit_button is not None
 
 
@@ -150,8 +129,8 @@ async def test_edit_dialog_opens_with_prefilled_form(
     # Navigate to locations page
     await logged_in_user.open("/admin/locations")
 
-    # Click the edit button
-    logged_in_user.find("edit").click()
+    # Click the edit button for Kühlschrank
+    logged_in_user.find(marker="edit-Kühlschrank").click()
 
     # Should see the edit dialog with pre-filled data
     await logged_in_user.should_see("Lagerort bearbeiten")
@@ -167,8 +146,8 @@ async def test_edit_location_validation_empty_name(
     # Navigate to locations page
     await logged_in_user.open("/admin/locations")
 
-    # Click the edit button
-    logged_in_user.find("edit").click()
+    # Click the edit button for Kühlschrank
+    logged_in_user.find(marker="edit-Kühlschrank").click()
 
     # Wait for dialog
     await logged_in_user.should_see("Lagerort bearbeiten")
@@ -192,8 +171,8 @@ async def test_edit_location_validation_duplicate_name(
     # Navigate to locations page
     await logged_in_user.open("/admin/locations")
 
-    # Click the first edit button (for Kühlschrank)
-    logged_in_user.find("edit").click()
+    # Click the edit button for Kühlschrank
+    logged_in_user.find(marker="edit-Kühlschrank").click()
 
     # Wait for dialog
     await logged_in_user.should_see("Lagerort bearbeiten")
@@ -218,8 +197,8 @@ async def test_edit_location_success(
     # Navigate to locations page
     await logged_in_user.open("/admin/locations")
 
-    # Click the edit button (first one = Kühlschrank)
-    logged_in_user.find("edit").click()
+    # Click the edit button for Kühlschrank
+    logged_in_user.find(marker="edit-Kühlschrank").click()
 
     # Wait for dialog
     await logged_in_user.should_see("Lagerort bearbeiten")
@@ -440,22 +419,16 @@ async def test_delete_dialog_can_be_cancelled(
 # =============================================================================
 
 
-async def test_create_location_dialog_shows_color_preview(user: TestUser) -> None:
+async def test_create_location_dialog_shows_color_preview(logged_in_user: TestUser) -> None:
     """Test that create location dialog shows a color preview element."""
-    # Login as admin
-    await user.open("/login")
-    user.find("Benutzername").type("admin")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
-
-    # Navigate to locations page
-    await user.open("/admin/locations")
+    # Navigate to locations page (already logged in via fixture)
+    await logged_in_user.open("/admin/locations")
 
     # Click the "Neuer Lagerort" button
-    user.find(marker="new-location-button").click()
+    logged_in_user.find(marker="new-location-button").click()
 
     # Should see color preview element (marker: color-preview)
-    preview = user.find(marker="color-preview")
+    preview = logged_in_user.find(marker="color-preview")
     assert preview is not None
 
 
@@ -467,8 +440,8 @@ async def test_edit_location_dialog_shows_color_preview(
     # standard_locations provides: Kühlschrank (#0000FF), Tiefkühler (#00FFFF), Speisekammer (#8B4513)
     await logged_in_user.open("/admin/locations")
 
-    # Find and click edit button (icon button)
-    logged_in_user.find("edit").click()
+    # Click the edit button for Kühlschrank
+    logged_in_user.find(marker="edit-Kühlschrank").click()
 
     # Should see color preview element
     preview = logged_in_user.find(marker="color-preview")
@@ -1,6 +1,7 @@
 """UI Tests for Login functionality."""
 
 from nicegui.testing import User as TestUser
+import pytest
 
 
 async def test_login_page_has_all_elements(user: TestUser) -> None:
@@ -39,9 +40,27 @@ async def test_root_redirects_to_login_when_not_authenticated(user: TestUser) ->
     await user.should_see("Anmelden")
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/profile",
+        "/admin/settings",
+        "/admin/categories",
+        "/admin/locations",
+        "/admin/users",
+        "/items/add",
+        "/items/1/edit",
+    ],
+)
+async def test_protected_page_redirects_to_login(user: TestUser, path: str) -> None:
+    """Test that protected pages redirect to login when not authenticated."""
+    await user.open(path)
+    await user.should_see(marker="login-button")
+
+
 async def test_root_redirects_to_dashboard_when_authenticated(logged_in_user: TestUser) -> None:
     """Test that / redirects to /dashboard when authenticated."""
     await logged_in_user.open("/")
-    # Should redirect to dashboard
-    await logged_in_user.should_see("Bald ablaufend")
+    # Should redirect to dashboard (the redirect is followed once the dashboard renders)
     await logged_in_user.should_see("Auf einen Blick")  # Issue #245
+    assert logged_in_user.back_history[-1] == "/dashboard"
@@ -21,7 +21,7 @@ async def test_logout_option_visible_in_dropdown(logged_in_user: User) -> None:
     await logged_in_user.open("/dashboard")
 
     # Click on username to open dropdown
-    logged_in_user.find("admin").click()
+    logged_in_user.find(marker="user-menu-button").click()
 
     # Should see "Abmelden" option in dropdown
     await logged_in_user.should_see("Abmelden")
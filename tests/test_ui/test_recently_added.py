@@ -3,7 +3,52 @@
 Issue #248: Show last N items added to inventory with relative date and location icon.
 """
 
+from app.models.item import Item
+from app.models.item import ItemType
+from app.models.location import Location
+from app.models.location import LocationType
+from app.ui.utils.date_utils import WEEKDAY_NAMES
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
 from nicegui.testing import User as TestUser
+import pytest
+from sqlmodel import Session
+
+
+@pytest.fixture
+def recently_added_items(isolated_test_database) -> list[Item]:
+    """Items added today, yesterday and 3 days ago, one per relative date format.
+
+    Returns:
+        List of Item objects: Tomatensoße (TK), Apfelmus (Vorr), Hackfleisch (TK)
+    """
+    now = datetime.now()
+    best_before = date.today() + timedelta(days=30)
+
+    with Session(isolated_test_database, expire_on_commit=False) as session:
+        location_frozen = Location(id=100, name="Tiefkühltruhe", location_type=LocationType.FROZEN, created_by=1)
+        location_ambient = Location(id=101, name="Vorratsraum", location_type=LocationType.AMBIENT, created_by=1)
+        items = [
+            Item(
+                product_name=product_name,
+                best_before_date=best_before,
+                quantity=1,
+                unit="Stück",
+                item_type=ItemType.PURCHASED_FRESH,
+                location_id=location_id,
+                created_by=1,
+                created_at=now - timedelta(days=days_ago),
+            )
+            for product_name, location_id, days_ago in (
+                ("Tomatensoße", 100, 0),
+                ("Apfelmus", 101, 1),
+                ("Hackfleisch", 100, 3),
+            )
+        ]
+        session.add_all([location_frozen, location_ambient, *items])
+        session.commit()
+        return items
 
 
 # =============================================================================
@@ -11,46 +56,28 @@ from nicegui.testing import User as TestUser
 # =============================================================================
 
 
-async def test_dashboard_shows_recently_added_section(user: TestUser) -> None:
-    """Test that dashboard shows 'Kürzlich hinzugefügt' section title (Issue #248)."""
-    await user.open("/test-dashboard-recently-added")
-    await user.should_see("Kürzlich hinzugefügt")
+async def test_dashboard_shows_recently_added_section(logged_in_user: TestUser, recently_added_items) -> None:
+    """Test that dashboard shows recently added items with relative date and location (Issue #248)."""
+    await logged_in_user.open("/dashboard")
 
+    # Section title and item names
+    await logged_in_user.should_see("Kürzlich hinzugefügt")
+    await logged_in_user.should_see("Tomatensoße")
+    await logged_in_user.should_see("Apfelmus")
+    await logged_in_user.should_see("Hackfleisch")
 
-async def test_dashboard_recently_added_shows_items(user: TestUser) -> None:
-    """Test that recently added section shows item names (Issue #248)."""
-    await user.open("/test-dashboard-recently-added")
-    await user.should_see("Tomatensoße")
-    await user.should_see("Apfelmus")
+    # Relative dates: today, yesterday and a weekday for items 2-6 days old
+    await logged_in_user.should_see("Heute")
+    await logged_in_user.should_see("Gestern")
+    await logged_in_user.should_see(WEEKDAY_NAMES[(date.today() - timedelta(days=3)).weekday()])
 
+    # Abbreviated location (TK = Tiefkühltruhe, Vorr = Vorratsraum)
+    await logged_in_user.should_see("TK")
+    await logged_in_user.should_see("Vorr")
 
-async def test_dashboard_recently_added_shows_relative_date_today(user: TestUser) -> None:
-    """Test that recently added section shows 'Heute' for items added today (Issue #248)."""
-    await user.open("/test-dashboard-recently-added-today")
-    await user.should_see("Heute")
 
-
-async def test_dashboard_recently_added_shows_relative_date_yesterday(user: TestUser) -> None:
-    """Test that recently added section shows 'Gestern' for items added yesterday (Issue #248)."""
-    await user.open("/test-dashboard-recently-added-yesterday")
-    await user.should_see("Gestern")
-
-
-async def test_dashboard_recently_added_shows_weekday(user: TestUser) -> None:
-    """Test that recently added section shows weekday for items 2-6 days old (Issue #248)."""
-    await user.open("/test-dashboard-recently-added-weekday")
-    # Should show a weekday name (Mo, Di, Mi, Do, Fr, Sa, So)
-    # The exact day depends on when the test runs, but the item is 3 days old
-
-
-async def test_dashboard_recently_added_hidden_when_empty(user: TestUser) -> None:
+async def test_dashboard_recently_added_hidden_when_empty(logged_in_user: TestUser) -> None:
     """Test that recently added section is hidden when no items exist (Issue #248)."""
-    await user.open("/test-dashboard-recently-added-empty")
-    await user.should_not_see("Kürzlich hinzugefügt")
-
-
-async def test_dashboard_recently_added_shows_location_info(user: TestUser) -> None:
-    """Test that recently added section shows location info (Issue #248)."""
-    await user.open("/test-dashboard-recently-added")
-    # Should show abbreviated location (TK = Tiefkühltruhe, Vorr = Vorratsraum, etc.)
-    await user.should_see("TK")
+    await logged_in_user.open("/dashboard")
+    await logged_in_user.should_see("Auf einen Blick")
+    await logged_in_user.should_not_see("Kürzlich hinzugefügt")
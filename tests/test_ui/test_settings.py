@@ -16,65 +16,27 @@ async def test_settings_page_renders_for_admin(logged_in_user: User) -> None:
     await logged_in_user.should_see("Einstellungen")
 
 
-async def test_settings_page_requires_auth(user: User) -> None:
-    """Test that unauthenticated users are redirected to login."""
-    await user.open("/admin/settings")
-    await user.should_see("Anmelden")
-
-
 # =============================================================================
-# Admin Navigation Tests (Issue #79)
+# Admin Navigation (Issue #79) and System Default Zeitfenster (Issue #34, #85)
 # =============================================================================
 
-
-async def test_settings_page_shows_admin_navigation(logged_in_user: User) -> None:
-    """Test that settings page shows admin navigation section."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Verwaltung")
-
-
-async def test_settings_page_shows_categories_link(logged_in_user: User) -> None:
-    """Test that settings page has link to categories."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Kategorien")
-
-
-async def test_settings_page_shows_locations_link(logged_in_user: User) -> None:
-    """Test that settings page has link to locations."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Lagerorte")
-
-
-async def test_settings_page_shows_users_link(logged_in_user: User) -> None:
-    """Test that settings page has link to users."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Benutzer")
-
-
-# =============================================================================
-# System Default Zeitfenster Tests (Issue #34, #85)
-# =============================================================================
-
-
-async def test_settings_page_shows_smart_defaults_section(logged_in_user: User) -> None:
-    """Test that settings page has a System Defaults section (renamed in #85)."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("System-Standardwerte")
-
-
-async def test_settings_page_shows_item_type_time_window(logged_in_user: User) -> None:
-    """Test that settings page shows item type time window input."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Artikel-Typ Zeitfenster")
-
-
-async def test_settings_page_shows_category_time_window(logged_in_user: User) -> None:
-    """Test that settings page shows category time window input."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Kategorie Zeitfenster")
-
-
-async def test_settings_page_shows_location_time_window(logged_in_user: User) -> None:
-    """Test that settings page shows location time window input."""
-    await logged_in_user.open("/admin/settings")
-    await logged_in_user.should_see("Lagerort Zeitfenster")
+# Texts of all sections, checked against a single render of /admin/settings
+SETTINGS_PAGE_TEXTS = (
+    # Admin navigation with links to categories, locations and users
+    "Verwaltung",
+    "Kategorien",
+    "Lagerorte",
+    "Benutzer",
+    # System defaults section (renamed in #85)
+    "System-Standardwerte",
+    "Artikel-Typ Zeitfenster",
+    "Kategorie Zeitfenster",
+    "Lagerort Zeitfenster",
+)
+
+
+async def test_settings_page_shows_all_sections(logged_in_user: User) -> None:
+    """Test that settings page shows admin navigation and system default time windows."""
+    await logged_in_user.open("/admin/settings")
+    for text in SETTINGS_PAGE_TEXTS:
+        await logged_in_user.should_see(text)
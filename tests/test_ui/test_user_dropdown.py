@@ -22,7 +22,7 @@ async def test_username_opens_dropdown_menu(logged_in_user: TestUser) -> None:
     await logged_in_user.open("/dashboard")
 
     # Click on the username button to open dropdown
-    logged_in_user.find("admin").click()
+    logged_in_user.find(marker="user-menu-button").click()
 
     # Should see dropdown menu items
     await logged_in_user.should_see("Abmelden")
@@ -33,10 +33,10 @@ async def test_dropdown_shows_logout_option(logged_in_user: TestUser) -> None:
     await logged_in_user.open("/dashboard")
 
     # Click on username to open dropdown
-    logged_in_user.find("admin").click()
+    logged_in_user.find(marker="user-menu-button").click()
 
     # Should see "Abmelden" option
-    await logged_in_user.should_see("Abmelden")
+    await logged_in_user.should_see(marker="logout-menu-item")
 
 
 async def test_dropdown_shows_settings_for_admin(logged_in_user: TestUser) -> None:
@@ -44,7 +44,7 @@ async def test_dropdown_shows_settings_for_admin(logged_in_user: TestUser) -> No
     await logged_in_user.open("/dashboard")
 
     # Click on username to open dropdown
-    logged_in_user.find("admin").click()
+    logged_in_user.find(marker="user-menu-button").click()
 
     # Admin should see "Einstellungen" option
     await logged_in_user.should_see("Einstellungen")
@@ -3,30 +3,29 @@
 Issue #28: Users Page - Liste aller Benutzer
 """
 
-from app.models.user import User
 from datetime import datetime
 from nicegui.testing import User as TestUser
-from sqlmodel import Session
 
 
-async def test_users_page_renders_for_admin(logged_in_user: TestUser) -> None:
-    """Test that users page renders for admin users."""
-    # Navigate to users page (already logged in via fixture)
-    await logged_in_user.open("/admin/users")
-
-    # Check page elements
-    await logged_in_user.should_see("Benutzer")
+# Texts of the header, user list and actions, checked against a single render of /admin/users
+USERS_PAGE_TEXTS = (
+    # Header with back navigation to settings
+    "Benutzer",
+    "Benutzer verwalten",
+    # Admin user from fixture with role and status
+    "admin",
+    "Admin",
+    "Aktiv",
+    # Issue #29: "Neuer Benutzer" button
+    "Neuer Benutzer",
+)
 
 
-async def test_users_page_shows_user_list(logged_in_user: TestUser) -> None:
-    """Test that users page displays user list with username, role, status."""
-    # Navigate to users page (already logged in via fixture)
+async def test_users_page_shows_all_sections(logged_in_user: TestUser) -> None:
+    """Test that users page shows header, user list with role and status, and new user button."""
     await logged_in_user.open("/admin/users")
-
-    # Admin user from fixture should be visible
-    await logged_in_user.should_see("admin")
-    await logged_in_user.should_see("Admin")  # Role display
-    await logged_in_user.should_see("Aktiv")  # Status
+    for text in USERS_PAGE_TEXTS:
+        await logged_in_user.should_see(text)
 
 
 async def test_users_page_displays_multiple_users(
@@ -51,21 +50,11 @@ async def test_users_page_displays_multiple_users(
 
 async def test_users_page_displays_last_login(
     logged_in_user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that users page displays last login time."""
     # Create user with last login
-    with Session(isolated_test_database) as session:
-        user_with_login = User(
-            username="loginuser",
-            email="loginuser@example.com",
-            is_active=True,
-            role="user",
-            last_login=datetime(2025, 11, 25, 10, 30),
-        )
-        user_with_login.set_password("password123")
-        session.add(user_with_login)
-        session.commit()
+    create_test_user("loginuser", last_login=datetime(2025, 11, 25, 10, 30))
 
     # Navigate to users page
     await logged_in_user.open("/admin/users")
@@ -74,37 +63,16 @@ async def test_users_page_displays_last_login(
     await logged_in_user.should_see("25.11.2025")
 
 
-async def test_users_page_requires_auth(user: TestUser) -> None:
-    """Test that unauthenticated users are redirected to login."""
-    # Try to access users without login
-    await user.open("/admin/users")
-
-    # Should be redirected to login
-    await user.should_see("Anmelden")
-
-
 async def test_users_page_requires_admin_permission(
     user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that regular users are redirected (no USER_MANAGE permission)."""
-    # Create a regular user
-    with Session(isolated_test_database) as session:
-        regular_user = User(
-            username="testuser",
-            email="testuser@example.com",
-            is_active=True,
-            role="user",
-        )
-        regular_user.set_password("password123")
-        session.add(regular_user)
-        session.commit()
-
-    # Login as regular user (manual login needed for non-admin user)
-    await user.open("/login")
-    user.find("Benutzername").type("testuser")
-    user.find("Passwort").type("password123")
-    user.find("Anmelden").click()
+    create_test_user("testuser")
+
+    # Login as regular user (session set directly, no login form)
+    await user.open("/test-login-user/testuser")
+    await user.should_see("Angemeldet als testuser")
 
     # Try to navigate to users page
     await user.open("/admin/users")
@@ -113,29 +81,11 @@ async def test_users_page_requires_admin_permission(
     await user.should_not_see("Benutzer verwalten")
 
 
-async def test_users_page_has_back_button(logged_in_user: TestUser) -> None:
-    """Test that users page has back button to settings."""
-    # Navigate to users page
-    await logged_in_user.open("/admin/users")
-
-    # Should have back button (arrow_back icon)
-    # The back button should navigate to /settings
-    await logged_in_user.should_see("Benutzer")
-
-
 # =============================================================================
 # Issue #29: User Creation Tests
 # =============================================================================
 
 
-async def test_users_page_has_new_user_button(logged_in_user: TestUser) -> None:
-    """Test that users page has 'Neuer Benutzer' button."""
-    await logged_in_user.open("/admin/users")
-
-    # Should see "Neuer Benutzer" button
-    await logged_in_user.should_see("Neuer Benutzer")
-
-
 async def test_new_user_button_opens_dialog(logged_in_user: TestUser) -> None:
     """Test that clicking 'Neuer Benutzer' opens a dialog with form."""
     await logged_in_user.open("/admin/users")
@@ -175,68 +125,6 @@ async def test_create_user_success(
     await logged_in_user.should_see("newuser")
 
 
-async def test_create_user_validation_username_required(
-    logged_in_user: TestUser,
-) -> None:
-    """Test that username is required."""
-    await logged_in_user.open("/admin/users")
-
-    # Click the "Neuer Benutzer" button
-    logged_in_user.find(marker="new-user-button").click()
-
-    # Fill in only other fields
-    logged_in_user.find("E-Mail").type("test@example.com")
-    logged_in_user.find(marker="password-input").type("password123")
-    logged_in_user.find(marker="password-confirm-input").type("password123")
-
-    # Try to save without username
-    logged_in_user.find("Speichern").click()
-
-    # Should see error message
-    await logged_in_user.should_see("Benutzername ist erforderlich")
-
-
-async def test_create_user_validation_email_required(
-    logged_in_user: TestUser,
-) -> None:
-    """Test that email is required."""
-    await logged_in_user.open("/admin/users")
-
-    # Click the "Neuer Benutzer" button
-    logged_in_user.find(marker="new-user-button").click()
-
-    # Fill in only other fields
-    logged_in_user.find("Benutzername").type("testuser")
-    logged_in_user.find(marker="password-input").type("password123")
-    logged_in_user.find(marker="password-confirm-input").type("password123")
-
-    # Try to save without email
-    logged_in_user.find("Speichern").click()
-
-    # Should see error message
-    await logged_in_user.should_see("E-Mail ist erforderlich")
-
-
-async def test_create_user_validation_password_required(
-    logged_in_user: TestUser,
-) -> None:
-    """Test that password is required."""
-    await logged_in_user.open("/admin/users")
-
-    # Click the "Neuer Benutzer" button
-    logged_in_user.find(marker="new-user-button").click()
-
-    # Fill in only other fields
-    logged_in_user.find("Benutzername").type("testuser")
-    logged_in_user.find("E-Mail").type("test@example.com")
-
-    # Try to save without password
-    logged_in_user.find("Speichern").click()
-
-    # Should see error message
-    await logged_in_user.should_see("Passwort ist erforderlich")
-
-
 async def test_create_user_validation_passwords_must_match(
     logged_in_user: TestUser,
 ) -> None:
@@ -345,20 +233,10 @@ async def test_edit_button_opens_dialog(
 
 async def test_edit_user_change_username(
     logged_in_user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that username can be changed."""
-    # Create a user to edit
-    with Session(isolated_test_database) as session:
-        test_user = User(
-            username="oldname",
-            email="oldname@example.com",
-            is_active=True,
-            role="user",
-        )
-        test_user.set_password("password123")
-        session.add(test_user)
-        session.commit()
+    create_test_user("oldname")
 
     await logged_in_user.open("/admin/users")
 
@@ -401,20 +279,10 @@ async def test_edit_user_change_role(
 
 async def test_edit_user_change_password(
     logged_in_user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that password can be changed optionally."""
-    # Create a user to edit
-    with Session(isolated_test_database) as session:
-        test_user = User(
-            username="pwduser",
-            email="pwduser@example.com",
-            is_active=True,
-            role="user",
-        )
-        test_user.set_password("oldpassword")
-        session.add(test_user)
-        session.commit()
+    create_test_user("pwduser", password="oldpassword")
 
     await logged_in_user.open("/admin/users")
 
@@ -434,20 +302,10 @@ async def test_edit_user_change_password(
 
 async def test_edit_user_password_mismatch(
     logged_in_user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that password change requires matching confirmation."""
-    # Create a user to edit
-    with Session(isolated_test_database) as session:
-        test_user = User(
-            username="pwdmismatch",
-            email="pwdmismatch@example.com",
-            is_active=True,
-            role="user",
-        )
-        test_user.set_password("password123")
-        session.add(test_user)
-        session.commit()
+    create_test_user("pwdmismatch")
 
     await logged_in_user.open("/admin/users")
 
@@ -467,20 +325,10 @@ async def test_edit_user_password_mismatch(
 
 async def test_edit_user_toggle_active_status(
     logged_in_user: TestUser,
-    isolated_test_database,
+    create_test_user,
 ) -> None:
     """Test that active status can be toggled."""
-    # Create an active user
-    with Session(isolated_test_database) as session:
-        test_user = User(
-            username="activeuser",
-            email="activeuser@example.com",
-            is_active=True,
-            role="user",
-        )
-        test_user.set_password("password123")
-        session.add(test_user)
-        session.commit()
+    create_test_user("activeuser")
 
     await logged_in_user.open("/admin/users")
 
@@ -559,18 +407,8 @@ async def test_cannot_delete_yourself(
     # The logged-in user is "admin"
     await logged_in_user.should_see("admin")
 
-    # Delete button for admin should not exist (or be disabled)
-    # We use a marker that won't exist for the current user
-    try:
-        logged_in_user.find(marker="delete-admin")
-        # If we get here, the button exists - test should fail
-        assert False, "Delete button should not exist for current user"
-    except AssertionError as e:
-        # Button doesn't exist - this is expected
-        if "Delete button should not exist" in str(e):
-            raise
-        # Expected: button not found
-        pass
+    # Delete button for admin should not exist
+    await logged_in_user.should_not_see(marker="delete-admin")
 
 
 async def test_delete_dialog_can_be_cancelled(
@@ -21,7 +21,7 @@ from sqlmodel import Session
 @pytest.fixture(name="location_in_db")
 def location_in_db_fixture(isolated_test_database) -> Location:
     """Create a location in the test database."""
-    with Session(isolated_test_database) as session:
+    with Session(isolated_test_database, expire_on_commit=False) as session:
         location = Location(
             name="Tiefkühltruhe",
             location_type=LocationType.FROZEN,
@@ -29,21 +29,14 @@ def location_in_db_fixture(isolated_test_database) -> Location:
         )
         session.add(location)
         session.commit()
-        session.refresh(location)
         return location
 
 
 async def test_wizard_shows_step1_initially(logged_in_user: User, location_in_db: Location) -> None:
-    """Test that wizard starts at Step 1."""
+    """Test that wizard starts at Step 1 with the Weiter button."""
     # Navigate to wizard (already logged in via fixture)
     await logged_in_user.open("/items/add")
     await logged_in_user.should_see("Schritt 1 von 3")
     await logged_in_user.should_see("Basisinformationen")
     await logged_in_user.should_see("Produktname")
-
-
-async def test_wizard_shows_weiter_button(logged_in_user: User, location_in_db: Location) -> None:
-    """Test that wizard shows Weiter button on Step 1."""
-    # Navigate to wizard (already logged in via fixture)
-    await logged_in_user.open("/items/add")
     await logged_in_user.should_see("Weiter")
@@ -0,0 +1,113 @@
+"""Unit tests for the pure helper functions of the item card component.
+
+Split from tests/test_ui/test_item_card.py: these tests need neither the
+NiceGUI user simulation nor an event loop.
+"""
+
+from app.models.item import ItemType
+from app.models.location import LocationType
+from app.ui.components.item_card import get_expiry_badge_class
+from app.ui.components.item_card import get_expiry_badge_text
+from app.ui.components.item_card import get_location_icon_name
+from datetime import date
+from datetime import timedelta
+
+
+# =============================================================================
+# Unit Tests for Badge Functions (Issue #212)
+# =============================================================================
+
+
+def test_get_expiry_badge_class_expired() -> None:
+    """Test badge class for expired items (days < 0)."""
+    assert get_expiry_badge_class(-1) == "expired"
+    assert get_expiry_badge_class(-5) == "expired"
+    assert get_expiry_badge_class(-100) == "expired"
+
+
+def test_get_expiry_badge_class_warning() -> None:
+    """Test badge class for warning items (days 0-1)."""
+    assert get_expiry_badge_class(0) == "warning"
+    assert get_expiry_badge_class(1) == "warning"
+
+
+def test_get_expiry_badge_class_soon() -> None:
+    """Test badge class for soon items (days 2-7)."""
+    assert get_expiry_badge_class(2) == "soon"
+    assert get_expiry_badge_class(5) == "soon"
+    assert get_expiry_badge_class(7) == "soon"
+
+
+def test_get_expiry_badge_class_ok() -> None:
+    """Test badge class for ok items (days > 7)."""
+    assert get_expiry_badge_class(8) == "ok"
+    assert get_expiry_badge_class(30) == "ok"
+    assert get_expiry_badge_class(365) == "ok"
+
+
+def test_get_expiry_badge_text_frozen_shows_date() -> None:
+    """Test badge text for frozen items shows date format."""
+    expiry = date.today() + timedelta(days=5)
+    for item_type in [
+        ItemType.PURCHASED_FROZEN,
+        ItemType.PURCHASED_THEN_FROZEN,
+        ItemType.HOMEMADE_FROZEN,
+    ]:
+        result = get_expiry_badge_text(expiry, item_type)
+        assert result == expiry.strftime("%d.%m.%y")
+
+
+def test_get_expiry_badge_text_fresh_expired() -> None:
+    """Test badge text for expired fresh items."""
+    expiry = date.today() - timedelta(days=1)
+    result = get_expiry_badge_text(expiry, ItemType.PURCHASED_FRESH)
+    assert result == "Abgelaufen"
+
+
+def test_get_expiry_badge_text_fresh_today() -> None:
+    """Test badge text for items expiring today."""
+    expiry = date.today()
+    result = get_expiry_badge_text(expiry, ItemType.PURCHASED_FRESH)
+    assert result == "Heute"
+
+
+def test_get_expiry_badge_text_fresh_tomorrow() -> None:
+    """Test badge text for items expiring tomorrow."""
+    expiry = date.today() + timedelta(days=1)
+    result = get_expiry_badge_text(expiry, ItemType.PURCHASED_FRESH)
+    assert result == "Morgen"
+
+
+def test_get_expiry_badge_text_fresh_in_x_days() -> None:
+    """Test badge text for items expiring in 2-7 days."""
+    for days in [2, 3, 5, 7]:
+        expiry = date.today() + timedelta(days=days)
+        result = get_expiry_badge_text(expiry, ItemType.PURCHASED_FRESH)
+        assert result == f"in {days} Tagen"
+
+
+def test_get_expiry_badge_text_fresh_far_shows_date() -> None:
+    """Test badge text for fresh items > 7 days shows date format."""
+    expiry = date.today() + timedelta(days=30)
+    result = get_expiry_badge_text(expiry, ItemType.PURCHASED_FRESH)
+    assert result == expiry.strftime("%d.%m.%y")
+
+
+# =============================================================================
+# Location Temperature Icon Tests (Issue #197)
+# =============================================================================
+
+
+def test_get_location_icon_frozen() -> None:
+    """Test that FROZEN location type returns freezer icon."""
+    assert get_location_icon_name(LocationType.FROZEN) == "locations/freezer"
+
+
+def test_get_location_icon_chilled() -> None:
+    """Test that CHILLED location type returns fridge icon."""
+    assert get_location_icon_name(LocationType.CHILLED) == "locations/fridge"
+
+
+def test_get_location_icon_ambient() -> None:
+    """Test that AMBIENT location type returns pantry icon."""
+    assert get_location_icon_name(LocationType.AMBIENT) == "locations/pantry"
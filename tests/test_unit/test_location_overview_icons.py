@@ -0,0 +1,23 @@
+"""Unit tests for the location type icons of the location overview component.
+
+Split from tests/test_ui/test_location_overview.py: these tests need neither
+the NiceGUI user simulation nor an event loop.
+"""
+
+from app.models.location import LocationType
+from app.ui.components.location_overview import get_location_type_icon
+
+
+def test_get_location_type_icon_frozen() -> None:
+    """Test that FROZEN locations get ac_unit icon."""
+    assert get_location_type_icon(LocationType.FROZEN) == "ac_unit"
+
+
+def test_get_location_type_icon_chilled() -> None:
+    """Test that CHILLED locations get kitchen icon."""
+    assert get_location_type_icon(LocationType.CHILLED) == "kitchen"
+
+
+def test_get_location_type_icon_ambient() -> None:
+    """Test that AMBIENT locations get home icon."""
+    assert get_location_type_icon(LocationType.AMBIENT) == "home"
@@ -0,0 +1,45 @@
+"""Unit tests for user create/edit dialog validation (Issue #29, #30)."""
+
+from app.ui.validation import validate_user_form
+
+
+def test_validate_user_form_valid() -> None:
+    """Test valid user form."""
+    assert validate_user_form("newuser", "new@example.com", "password123", "password123") is None
+
+
+def test_validate_user_form_username_required() -> None:
+    """Test that username is required."""
+    assert validate_user_form("", "test@example.com", "password123", "password123") == "Benutzername ist erforderlich"
+
+
+def test_validate_user_form_email_required() -> None:
+    """Test that email is required."""
+    assert validate_user_form("testuser", "", "password123", "password123") == "E-Mail ist erforderlich"
+
+
+def test_validate_user_form_password_required() -> None:
+    """Test that password is required when creating a user."""
+    assert validate_user_form("testuser", "test@example.com", "", "") == "Passwort ist erforderlich"
+
+
+def test_validate_user_form_passwords_must_match() -> None:
+    """Test that password and confirmation must match."""
+    error = validate_user_form("testuser", "test@example.com", "password123", "differentpassword")
+    assert error == "Passwörter stimmen nicht überein"
+
+
+def test_validate_user_form_first_error_wins() -> None:
+    """Test that only the first error is reported (shown in a single error label)."""
+    assert validate_user_form("", "", "", "") == "Benutzername ist erforderlich"
+
+
+def test_validate_user_form_password_optional_when_editing() -> None:
+    """Test that an empty password keeps the current one when editing."""
+    assert validate_user_form("testuser", "test@example.com", "", "", password_required=False) is None
+
+
+def test_validate_user_form_edit_passwords_must_match() -> None:
+    """Test that a new password must match its confirmation when editing."""
+    error = validate_user_form("testuser", "test@example.com", "newpassword123", "", password_required=False)
+    assert error == "Passwörter stimmen nicht überein"
@@ -2,10 +2,21 @@
 
 from app.models.item import ItemType
 from app.ui.validation import is_step1_valid
+from app.ui.validation import is_step2_valid
+from app.ui.validation import is_step3_valid
+from app.ui.validation import requires_category
+from app.ui.validation import validate_best_before_date
+from app.ui.validation import validate_category
+from app.ui.validation import validate_freeze_date
 from app.ui.validation import validate_item_type
+from app.ui.validation import validate_location
 from app.ui.validation import validate_product_name
 from app.ui.validation import validate_quantity
 from app.ui.validation import validate_step1
+from app.ui.validation import validate_step2
+from app.ui.validation import validate_step3
+from datetime import date
+from datetime import timedelta
 
 
 # Product Name Validation Tests
@@ -171,10 +182,6 @@ def test_is_step1_valid_returns_false_with_one_error() -> None:
 
 def test_validate_best_before_date_valid() -> None:
     """Test valid best before dates."""
-    from app.ui.validation import validate_best_before_date
-    from datetime import date
-    from datetime import timedelta
-
     assert validate_best_before_date(date.today()) is None
     assert validate_best_before_date(date.today() + timedelta(days=30)) is None
     assert validate_best_before_date(date.today() - timedelta(days=7)) is None
@@ -182,16 +189,11 @@ def test_validate_best_before_date_valid() -> None:
 
 def test_validate_best_before_date_none() -> None:
     """Test best before date is None."""
-    from app.ui.validation import validate_best_before_date
-
     assert validate_best_before_date(None) == "Datum erforderlich"
 
 
 def test_validate_freeze_date_required_for_frozen() -> None:
     """Test freeze date required for self-frozen types only."""
-    from app.ui.validation import validate_freeze_date
-    from datetime import date
-
     # PURCHASED_FROZEN (TK-Ware gekauft) should NOT require freeze_date
     # It has MHD on the package, no freeze date needed
     error = validate_freeze_date(None, ItemType.PURCHASED_FROZEN, date.today())
@@ -207,9 +209,6 @@ def test_validate_freeze_date_required_for_frozen() -> None:
 
 def test_validate_freeze_date_not_required_for_fresh() -> None:
     """Test freeze date not required for non-self-frozen types."""
-    from app.ui.validation import validate_freeze_date
-    from datetime import date
-
     # Fresh items don't need freeze date
     error = validate_freeze_date(None, ItemType.PURCHASED_FRESH, date.today())
     assert error is None
@@ -225,9 +224,6 @@ def test_validate_freeze_date_not_required_for_fresh() -> None:
 
 def test_validate_freeze_date_cannot_be_before_best_before() -> None:
     """Test freeze date validation against best_before."""
-    from app.ui.validation import validate_freeze_date
-    from datetime import date
-
     best_before = date(2024, 1, 1)
     freeze_date_val = date(2023, 12, 1)  # Before best_before
 
@@ -238,9 +234,6 @@ def test_validate_freeze_date_cannot_be_before_best_before() -> None:
 
 def test_validate_freeze_date_valid_after_best_before() -> None:
     """Test valid freeze date after best_before."""
-    from app.ui.validation import validate_freeze_date
-    from datetime import date
-
     best_before = date(2024, 1, 1)
     freeze_date_val = date(2024, 1, 15)  # After best_before
 
@@ -250,9 +243,6 @@ def test_validate_freeze_date_valid_after_best_before() -> None:
 
 def test_validate_step2_all_valid_non_frozen() -> None:
     """Test Step 2 validation with all valid fields for non-frozen item."""
-    from app.ui.validation import validate_step2
-    from datetime import date
-
     errors = validate_step2(
         item_type=ItemType.PURCHASED_FRESH,
         best_before=date.today(),
@@ -263,9 +253,6 @@ def test_validate_step2_all_valid_non_frozen() -> None:
 
 def test_validate_step2_all_valid_frozen() -> None:
     """Test Step 2 validation with all valid fields for frozen item."""
-    from app.ui.validation import validate_step2
-    from datetime import date
-
     errors = validate_step2(
         item_type=ItemType.PURCHASED_FROZEN,
         best_before=date(2024, 1, 1),
@@ -276,8 +263,6 @@ def test_validate_step2_all_valid_frozen() -> None:
 
 def test_validate_step2_missing_best_before() -> None:
     """Test Step 2 validation with missing best_before."""
-    from app.ui.validation import validate_step2
-
     errors = validate_step2(
         item_type=ItemType.PURCHASED_FRESH,
         best_before=None,
@@ -289,9 +274,6 @@ def test_validate_step2_missing_best_before() -> None:
 
 def test_validate_step2_frozen_missing_freeze_date() -> None:
     """Test Step 2 validation with frozen type but missing freeze_date."""
-    from app.ui.validation import validate_step2
-    from datetime import date
-
     errors = validate_step2(
         item_type=ItemType.HOMEMADE_FROZEN,
         best_before=date.today(),
@@ -303,9 +285,6 @@ def test_validate_step2_frozen_missing_freeze_date() -> None:
 
 def test_is_step2_valid_returns_true_when_valid() -> None:
     """Test is_step2_valid returns True for valid inputs."""
-    from app.ui.validation import is_step2_valid
-    from datetime import date
-
     assert (
         is_step2_valid(
             item_type=ItemType.PURCHASED_FRESH,
@@ -327,8 +306,6 @@ def test_is_step2_valid_returns_true_when_valid() -> None:
 
 def test_is_step2_valid_returns_false_when_invalid() -> None:
     """Test is_step2_valid returns False for invalid inputs."""
-    from app.ui.validation import is_step2_valid
-
     assert (
         is_step2_valid(
             item_type=ItemType.PURCHASED_FROZEN,
@@ -344,8 +321,6 @@ def test_is_step2_valid_returns_false_when_invalid() -> None:
 
 def test_requires_category_for_frozen_types() -> None:
     """Test that frozen types require a category."""
-    from app.ui.validation import requires_category
-
     # Types that need category for shelf life calculation
     assert requires_category(ItemType.PURCHASED_THEN_FROZEN) is True
     assert requires_category(ItemType.HOMEMADE_FROZEN) is True
@@ -354,8 +329,6 @@ def test_requires_category_for_frozen_types() -> None:
 
 def test_requires_category_not_for_mhd_types() -> None:
     """Test that MHD types don't require a category."""
-    from app.ui.validation import requires_category
-
     # Types that use MHD from package - no category needed
     assert requires_category(ItemType.PURCHASED_FRESH) is False
     assert requires_category(ItemType.PURCHASED_FROZEN) is False
@@ -363,9 +336,6 @@ def test_requires_category_not_for_mhd_types() -> None:
 
 def test_is_step2_valid_with_category_for_frozen_types() -> None:
     """Test Step 2 validation requires category for frozen types."""
-    from app.ui.validation import is_step2_valid
-    from datetime import date
-
     # Frozen type without category - invalid
     assert (
         is_step2_valid(
@@ -391,9 +361,6 @@ def test_is_step2_valid_with_category_for_frozen_types() -> None:
 
 def test_is_step2_valid_without_category_for_mhd_types() -> None:
     """Test Step 2 validation doesn't require category for MHD types."""
-    from app.ui.validation import is_step2_valid
-    from datetime import date
-
     # MHD type without category - still valid (uses best_before from package)
     assert (
         is_step2_valid(
@@ -421,23 +388,17 @@ def test_is_step2_valid_without_category_for_mhd_types() -> None:
 
 def test_validate_location_valid() -> None:
     """Test valid location ID."""
-    from app.ui.validation import validate_location
-
     assert validate_location(1) is None
     assert validate_location(42) is None
 
 
 def test_validate_location_none() -> None:
     """Test location is None."""
-    from app.ui.validation import validate_location
-
     assert validate_location(None) == "Bitte Lagerort auswählen"
 
 
 def test_validate_category_required() -> None:
     """Test category is now required."""
-    from app.ui.validation import validate_category
-
     assert validate_category(None) == "Kategorie ist erforderlich"
     assert validate_category(1) is None
     assert validate_category(42) is None
@@ -445,16 +406,12 @@ def test_validate_category_required() -> None:
 
 def test_validate_step3_all_valid() -> None:
     """Test Step 3 validation with location only (category moved to Step 2)."""
-    from app.ui.validation import validate_step3
-
     errors = validate_step3(location_id=1)
     assert errors == {}
 
 
 def test_validate_step3_missing_location() -> None:
     """Test Step 3 validation with missing location."""
-    from app.ui.validation import validate_step3
-
     errors = validate_step3(location_id=None)
     assert "location" in errors
     assert errors["location"] == "Bitte Lagerort auswählen"
@@ -462,14 +419,10 @@ def test_validate_step3_missing_location() -> None:
 
 def test_is_step3_valid_returns_true_when_valid() -> None:
     """Test is_step3_valid returns True for valid inputs."""
-    from app.ui.validation import is_step3_valid
-
     assert is_step3_valid(location_id=1) is True
     assert is_step3_valid(location_id=5) is True
 
 
 def test_is_step3_valid_returns_false_when_invalid() -> None:
     """Test is_step3_valid returns False for invalid inputs."""
-    from app.ui.validation import is_step3_valid
-
     assert is_step3_valid(location_id=None) is False